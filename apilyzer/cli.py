@@ -1,16 +1,51 @@
 import asyncio
+import atexit
 
 from rich.console import Console
 from typer import Argument, Context, Option, Typer
 
+from apilyzer.http import close_client, get_client
 from apilyzer.verify import (
     analyze_api_maturity,
     check_documentation_json,
     estimate_rate_limit,
 )
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 console = Console()
 app = Typer()
+_loop = None
+
+
+def _shutdown():
+    if _loop is not None and not _loop.is_closed():
+        _loop.run_until_complete(close_client())
+        _loop.close()
+
+
+atexit.register(_shutdown)
+
+
+def _run(coro):
+    """Run the coroutine in the event loop shared by every command of the process.
+
+    The loop (uvloop when it is installed) and the HTTP client are created on the first call and closed at interpreter exit.
+    """
+    global _loop
+
+    if _loop is None or _loop.is_closed():
+        _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    return _loop.run_until_complete(_with_shared_client(coro))
+
+
+async def _with_shared_client(coro):
+    """Await the coroutine once the loop owns the shared HTTP client, so the verification functions reuse it."""
+    get_client()
+    return await coro
 
 
 @app.callback(invoke_without_command=True)
@@ -56,7 +91,7 @@ def verify_rest(
         help='Endpoint of the API documentation. If not provided, we will try to identify it with the base URL alone',
     ),
 ):
-    result = asyncio.run(check_documentation_json(url, doc_endpoint))
+    result = _run(check_documentation_json(url, doc_endpoint))
     console.print(result)
 
 
@@ -71,8 +106,15 @@ def verify_maturity(
         '-e',
         help='Endpoint of the API documentation. If not provided, we will try to identify it with the base URL alone',
     ),
+    fast: bool = Option(
+        False,
+        '--fast',
+        help='Skip the HTTPS support check',
+    ),
 ):
-    result = asyncio.run(analyze_api_maturity(url, doc_endpoint))
+    result = _run(
+        analyze_api_maturity(url, doc_endpoint, check_https=not fast)
+    )
     console.print(result)
 
 
@@ -84,6 +126,13 @@ def test_rate(
     rate: int = Argument(
         '50', help='Number of requests to test if the API is able to resist.'
     ),
+    concurrency: int = Option(
+        50,
+        '--concurrency',
+        '-c',
+        min=1,
+        help='Maximum number of requests sent at the same time.',
+    ),
 ):
-    result = asyncio.run(estimate_rate_limit(url, rate))
+    result = _run(estimate_rate_limit(url, rate, concurrency=concurrency))
     console.print(result)
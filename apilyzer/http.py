@@ -0,0 +1,123 @@
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+
+import httpx
+
+_TIMEOUT = httpx.Timeout(connect=2.0, read=5.0, write=2.0, pool=10.0)
+_client = None
+_client_loop = None
+_default_clients = weakref.WeakSet()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client used by the verification functions.
+
+    The client keeps a pool of keep-alive connections (HTTP/2 when the server supports it), so consecutive requests to the same host reuse the TCP+TLS session instead of opening a new one.
+    Unreachable hosts fail after 2 seconds, and silent servers after 5 seconds without data. Waiting for a free pooled connection may take longer, since rate limit estimates can run more requests at once than the pool holds.
+    Requests prefer JSON through the Accept header, so servers negotiating the content type answer with their JSON representation.
+    The client belongs to the running event loop, which must close it with close_client before ending. A new client is created when the previous one was closed or belongs to another event loop.
+
+    Returns:
+        httpx.AsyncClient: The shared asynchronous HTTP client.
+
+    Examples:
+        >>> import asyncio
+        >>> async def main():
+        ...     try:
+        ...         return await get_client().get('http://127.0.0.1:8000')
+        ...     finally:
+        ...         await close_client()
+        >>> asyncio.run(main()) # doctest: +SKIP
+        <Response [200 OK]>
+    """
+    global _client, _client_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _new_client()
+        _client_loop = loop
+
+    return _client
+
+
+def _new_client() -> httpx.AsyncClient:
+    client = httpx.AsyncClient(
+        follow_redirects=True,
+        headers={
+            'User-Agent': 'API Checker',
+            'Accept': 'application/json, text/html;q=0.5, */*;q=0.1',
+        },
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30,
+        ),
+        timeout=_TIMEOUT,
+    )
+    _default_clients.add(client)
+    return client
+
+
+def is_default_client(client: httpx.AsyncClient) -> bool:
+    """Check if the client was created by get_client or open_client, rather than passed in by a caller.
+
+    Default clients share the same settings, so the results of their requests can be shared as well.
+
+    Parameters:
+        client (httpx.AsyncClient): The client to be checked.
+
+    Returns:
+        bool: True if the client is a default client, False otherwise.
+    """
+    return client in _default_clients
+
+
+@asynccontextmanager
+async def open_client():
+    """Provide the HTTP client used by a verification function called without one.
+
+    The shared client of get_client is used when it belongs to the running event loop, as in the command line interface. Otherwise a new client with the same settings is created and closed on exit, so no connection outlives the call.
+
+    Yields:
+        httpx.AsyncClient: The asynchronous HTTP client.
+
+    Examples:
+        >>> import asyncio
+        >>> async def main():
+        ...     async with open_client() as client:
+        ...         return await client.get('http://127.0.0.1:8000')
+        >>> asyncio.run(main()) # doctest: +SKIP
+        <Response [200 OK]>
+    """
+    if (
+        _client is not None
+        and not _client.is_closed
+        and _client_loop is asyncio.get_running_loop()
+    ):
+        yield _client
+    else:
+        async with _new_client() as client:
+            yield client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, releasing its pooled connections.
+
+    A client created in another event loop is only discarded, since its connections can no longer be closed from the current one.
+
+    Examples:
+        >>> import asyncio
+        >>> asyncio.run(close_client()) # doctest: +SKIP
+    """
+    global _client, _client_loop
+
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
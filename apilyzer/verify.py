@@ -1,17 +1,213 @@
 import asyncio
-import json
+import atexit
+import codecs
+import os
+import re
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
 
 import httpx
+import orjson
+
+from apilyzer.http import is_default_client, open_client
+
+_DOCUMENTATION_CACHE_SIZE = 32
+_DOCUMENTATION_CACHE_TTL = 300
+_documentation_cache = OrderedDict()
+_documentation_discoveries = {}
+_DOCUMENTATION_ENDPOINTS = (
+    'openapi.json',
+    'swagger.json',
+    'docs',
+    'api-docs',
+    'swagger',
+    'redoc',
+    'api/docs',
+    'swagger/ui',
+    '',
+)
+_ENDPOINT_HITS_PATH = (
+    Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    / 'apilyzer'
+    / 'endpoint_hits.json'
+)
+_endpoint_hits = None
+_json_bodies = weakref.WeakKeyDictionary()
+_MAX_RESPONSE_BYTES = 32 * 1024 * 1024
+_API_TERMS_RE = re.compile(
+    rb'swagger|openapi|endpoints|paths|documentation', re.IGNORECASE
+)
+_API_TERMS_SCAN_BYTES = 256 * 1024
+_DOCUMENTATION_KEYS = ('openapi', 'swagger', 'paths')
+_JSON_CONTAINER_RE = re.compile(rb'\s*[\[{]')
+_ALLOW_VERB_RE = re.compile(r'\b(?:GET|POST|PUT|PATCH|DELETE)\b')
+_BINARY_CONTENT_TYPE_RE = re.compile(
+    r'\s*(?:(?:image|audio|video|font)/|application/(?:octet-stream|zip|gzip|x-gzip)\b)'
+)
+_RATE_LIMIT_BODY_BYTES = 64 * 1024
+_NO_RESPONSES = {}
+_EXPECTED_RESPONSES = {
+    'get': {
+        '200': 'OK',
+    },
+    'post': {
+        '201': 'Created',
+    },
+    'put': {
+        '200': 'OK',
+    },
+    'patch': {
+        '200': 'OK',
+    },
+    'delete': {
+        '200': 'OK',
+    },
+}
+
+
+async def _read_limited(response: httpx.Response, max_bytes: int) -> None:
+    """Read the body of a streamed response, failing once more than max_bytes were decoded.
+
+    The limit applies to the decoded body, so compressed responses cannot expand past it in memory.
+
+    Parameters:
+        response (httpx.Response): The streamed response being read.
+        max_bytes (int): The maximum number of decoded bytes to read.
+    """
+    chunks = []
+    received = 0
+    async for chunk in response.aiter_bytes():
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValueError(f'The response body exceeds {max_bytes} bytes')
+        chunks.append(chunk)
+    response._content = b''.join(chunks)
+
+
+def _is_json(response: httpx.Response) -> bool:
+    """Check if the response declares a JSON body in its Content-Type header.
+
+    Parameters:
+        response (httpx.Response): The response to be checked.
+
+    Returns:
+        bool: True if the Content-Type is JSON, False otherwise.
+    """
+    return 'application/json' in response.headers.get('Content-Type', '')
+
+
+def _json_content(response: httpx.Response) -> bytes:
+    """Return the body of the response without a leading UTF-8 byte order mark, which orjson rejects.
+
+    Parameters:
+        response (httpx.Response): The response whose body is returned.
+
+    Returns:
+        bytes: The body of the response.
+    """
+    return response.content.removeprefix(codecs.BOM_UTF8)
+
+
+def _json_body(response: httpx.Response):
+    """Parse the JSON body of the response, reusing the result of a previous parse of the same response.
+
+    Parameters:
+        response (httpx.Response): The response whose body is parsed.
+
+    Returns:
+        The parsed JSON body.
+    """
+    try:
+        return _json_bodies[response]
+    except KeyError:
+        data = _json_bodies[response] = orjson.loads(_json_content(response))
+        return data
+
+
+def _json_documentation(full_url: str, response: httpx.Response) -> dict:
+    """Build the result of check_documentation_json for a JSON documentation found at full_url.
+
+    Parameters:
+        full_url (str): The URL where the documentation was found.
+        response (httpx.Response): The response of the documentation request.
+
+    Returns:
+        dict: A dictionary containing the 'status', 'message', and 'response' keys, with the parsed documentation as 'response'.
+    """
+    return {
+        'status': 'success',
+        'message': f'REST API JSON documentation found at {full_url}',
+        'response': _json_body(response),
+    }
+
+
+def _has_documentation_terms(response: httpx.Response) -> bool:
+    """Check if the body of the response mentions an API documentation.
+
+    JSON bodies are parsed (once, shared with _json_documentation) and recognized by their top-level openapi, swagger or paths key, wherever it is serialized, and otherwise searched whole for documentation terms. Other bodies, and invalid JSON, are only searched in their first 256 KiB.
+
+    Parameters:
+        response (httpx.Response): The response to be checked.
+
+    Returns:
+        bool: True if the body looks like an API documentation, False otherwise.
+    """
+    if _is_json(response) and _JSON_CONTAINER_RE.match(
+        _json_content(response)
+    ):
+        try:
+            data = _json_body(response)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if isinstance(data, dict) and any(
+                key in data for key in _DOCUMENTATION_KEYS
+            ):
+                return True
+            return bool(_API_TERMS_RE.search(response.content))
+
+    return bool(
+        _API_TERMS_RE.search(response.content, 0, _API_TERMS_SCAN_BYTES)
+    )
 
 
-async def _is_json_rest_api(uri: str) -> (bool, httpx.Response):
+def _may_be_documentation(response: httpx.Response) -> bool:
+    """Check if the body of a successful HEAD response is worth downloading to look for documentation.
+
+    Only bodies declared as clearly binary (images, audio, video, fonts and archives) are skipped. Any other body, such as JSON, YAML, XML or HTML, may hold documentation.
+
+    Parameters:
+        response (httpx.Response): The HEAD response to be checked.
+
+    Returns:
+        bool: True if the body should be requested with GET, False otherwise.
+    """
+    content_type = response.headers.get('Content-Type', '').lower()
+    return not _BINARY_CONTENT_TYPE_RE.match(content_type)
+
+
+async def _is_json_rest_api(
+    uri: str,
+    client: httpx.AsyncClient = None,
+    head_first: bool = False,
+    headers: dict = None,
+) -> (bool, httpx.Response):
     """Verifies if the given URI belongs to a JSON REST API and returns the response.
 
     This function sends a GET request to the URI and checks the response headers and content to determine whether it is a REST API.
     Currently, this function recognizes only APIs that return JSON content.
 
+    When head_first is set, a HEAD request is sent before the GET. Non-2xx responses, and 2xx responses whose body cannot hold documentation (such as images or archives), are returned without downloading their body.
+    Servers that do not support HEAD (405 or 501) are requested with GET as usual.
+    The download is aborted with a ValueError once the decoded body exceeds 32 MiB.
+
     Parameters:
         uri (str): The URI to be checked.
+        client (httpx.AsyncClient, optional): The HTTP client used to send the request. Defaults to the client of apilyzer.http.open_client.
+        head_first (bool, optional): Whether to send a HEAD request before the GET. Defaults to False.
+        headers (dict, optional): Extra headers sent with the GET request. Defaults to None.
 
     Returns:
         bool: True if the API is JSON REST, False otherwise.
@@ -22,15 +218,29 @@ async def _is_json_rest_api(uri: str) -> (bool, httpx.Response):
         >>> asyncio.run(_is_json_rest_api('http://127.0.0.1:8000')) # doctest: +SKIP
         True, <Response [200 OK]>
     """
-    if not (uri.startswith('http')):
+    if not uri.startswith(('http://', 'https://')):
         return False, None
 
+    if client is None:
+        async with open_client() as client:
+            return await _is_json_rest_api(uri, client, head_first, headers)
+
     try:
-        async with httpx.AsyncClient(
-            follow_redirects=True, headers={'User-Agent': 'API Checker'}
-        ) as client:
-            url = uri.rstrip('/')
-            response = await client.get(url, timeout=10)
+        url = uri.rstrip('/')
+        if head_first:
+            response = await client.head(url)
+            if response.status_code // 100 == 2:
+                if not _may_be_documentation(response):
+                    return False, response
+            elif response.status_code not in (405, 501):
+                return False, response
+        response = await client.send(
+            client.build_request('GET', url, headers=headers), stream=True
+        )
+        try:
+            await _read_limited(response, _MAX_RESPONSE_BYTES)
+        finally:
+            await response.aclose()
     except httpx.ConnectError:
         return False, None
 
@@ -38,28 +248,176 @@ async def _is_json_rest_api(uri: str) -> (bool, httpx.Response):
         return False, response
 
     allow_header = response.headers.get('access-control-allow-methods', '')
-    if any(
-        verb in allow_header
-        for verb in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
-    ):
+    if _ALLOW_VERB_RE.search(allow_header):
         return True, response
 
-    content_type = response.headers.get('Content-Type', '')
-
-    if 'application/json' in content_type:
-        data = response.json()
-        if isinstance(data, (list, dict)):
+    if _is_json(response) and _JSON_CONTAINER_RE.match(
+        _json_content(response)
+    ):
+        if isinstance(_json_body(response), (list, dict)):
             return True, response
 
     return False, response
 
 
-async def check_documentation_json(uri: str, doc_endpoint: str = None) -> dict:
+def _load_endpoint_hits() -> dict:
+    """Load how many times each documentation endpoint was the one found, persisted across runs.
+
+    The counters are read once per process and written back at interpreter exit. Entries whose count is not an integer are ignored.
+
+    Returns:
+        dict: A dictionary mapping each endpoint to its number of hits.
+    """
+    global _endpoint_hits
+
+    if _endpoint_hits is None:
+        try:
+            _endpoint_hits = orjson.loads(_ENDPOINT_HITS_PATH.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            _endpoint_hits = {}
+        if isinstance(_endpoint_hits, dict):
+            _endpoint_hits = {
+                endpoint: hits
+                for endpoint, hits in _endpoint_hits.items()
+                if type(hits) is int
+            }
+        else:
+            _endpoint_hits = {}
+        atexit.register(_save_endpoint_hits, dict(_endpoint_hits))
+
+    return _endpoint_hits
+
+
+def _save_endpoint_hits(loaded_hits: dict) -> None:
+    """Persist the documentation endpoint hits if they changed since they were loaded.
+
+    Parameters:
+        loaded_hits (dict): The hits as they were when loaded.
+    """
+    if _endpoint_hits is None or _endpoint_hits == loaded_hits:
+        return
+
+    try:
+        _ENDPOINT_HITS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _ENDPOINT_HITS_PATH.write_bytes(orjson.dumps(_endpoint_hits))
+    except OSError:
+        pass
+
+
+def _cache_documentation(
+    key: tuple,
+    full_url: str,
+    response: httpx.Response,
+    result: dict,
+    cache_ttl: float,
+) -> None:
+    """Store a JSON documentation found at full_url so it can be reused later.
+
+    The documentation is reused as is for cache_ttl seconds. After that, it is revalidated if the response carried an ETag or Last-Modified header, and dropped otherwise.
+
+    Parameters:
+        key (tuple): The (base URL, documentation endpoint) pair used to look the documentation up.
+        full_url (str): The URL where the documentation was found.
+        response (httpx.Response): The response of the documentation request.
+        result (dict): The result returned by check_documentation_json.
+        cache_ttl (float): The number of seconds the documentation is reused without revalidation.
+    """
+    validators = {}
+    if 'ETag' in response.headers:
+        validators['If-None-Match'] = response.headers['ETag']
+    if 'Last-Modified' in response.headers:
+        validators['If-Modified-Since'] = response.headers['Last-Modified']
+
+    if not validators and cache_ttl <= 0:
+        _documentation_cache.pop(key, None)
+        return
+
+    expires_at = time.monotonic() + cache_ttl
+    _documentation_cache[key] = (expires_at, full_url, validators, result)
+    _documentation_cache.move_to_end(key)
+    while len(_documentation_cache) > _DOCUMENTATION_CACHE_SIZE:
+        _documentation_cache.popitem(last=False)
+
+
+async def _cached_documentation(
+    key: tuple, client: httpx.AsyncClient, cache_ttl: float
+) -> dict:
+    """Return the cached documentation for the given key if it is still valid.
+
+    Fresh entries are returned without any request. Expired ones are revalidated with a conditional GET to the URL where the documentation was found: a 304 response means the cached result can be reused without downloading or parsing the document again.
+    A changed document goes through the same checks as during discovery. The entry is dropped if it fails them or the request fails, so the documentation is discovered again.
+
+    Parameters:
+        key (tuple): The (base URL, documentation endpoint) pair used to look the documentation up.
+        client (httpx.AsyncClient): The HTTP client used to send the request.
+        cache_ttl (float): The number of seconds a revalidated documentation is reused without revalidation.
+
+    Returns:
+        dict: The result of check_documentation_json, or None if the documentation is not cached or has changed.
+    """
+    entry = _documentation_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, full_url, validators, result = entry
+    if time.monotonic() < expires_at:
+        _documentation_cache.move_to_end(key)
+        return result
+
+    if not validators:
+        del _documentation_cache[key]
+        return None
+
+    try:
+        is_rest, response = await _is_json_rest_api(
+            full_url, client, headers=validators
+        )
+    except (httpx.HTTPError, ValueError):
+        _documentation_cache.pop(key, None)
+        return None
+
+    if response is not None and response.status_code == 304:
+        _documentation_cache[key] = (
+            time.monotonic() + cache_ttl,
+            full_url,
+            validators,
+            result,
+        )
+        _documentation_cache.move_to_end(key)
+        return result
+
+    _documentation_cache.pop(key, None)
+    if is_rest and _is_json(response) and _has_documentation_terms(response):
+        try:
+            result = _json_documentation(full_url, response)
+        except orjson.JSONDecodeError:
+            return None
+        _cache_documentation(key, full_url, response, result, cache_ttl)
+        return result
+
+    return None
+
+
+async def check_documentation_json(
+    uri: str,
+    doc_endpoint: str = None,
+    client: httpx.AsyncClient = None,
+    cache_ttl: float = _DOCUMENTATION_CACHE_TTL,
+    use_cache: bool = True,
+) -> dict:
     """Check if the given base URI of an API has REST API documentation available. If the documentation endpoint is not specified, the function will try to identify it.
 
+    Candidate endpoints are probed concurrently. The endpoints found most often in previous runs take priority, so the usual documentation location is picked first.
+    JSON documentations found with the default client are cached, and concurrent checks of the same URI share a single discovery. Cached results are shared by every caller that gets them, so they must not be modified.
+    Checks made with a client passed in by the caller, whose authentication or transport may differ, always probe the endpoints and are never cached.
+    JSON documentations are recognized by their top-level openapi, swagger or paths key. Documentation terms are only searched in the first 256 KiB of the other responses.
+
     Parameters:
         uri (str): The base URI of the API.
         doc_endpoint (str, optional): The endpoint where the documentation is available. Defaults to None.
+        client (httpx.AsyncClient, optional): The HTTP client used to send the requests. Defaults to the client of apilyzer.http.open_client.
+        cache_ttl (float, optional): The number of seconds a found documentation is reused without revalidation. Defaults to 300.
+        use_cache (bool, optional): Whether to reuse and store cached documentations. When False, the endpoints are always probed. Defaults to True.
 
     Returns:
         dict: A dictionary containing the 'status', 'message', and 'response' keys detailing the outcome of the check.
@@ -69,83 +427,148 @@ async def check_documentation_json(uri: str, doc_endpoint: str = None) -> dict:
         >>> asyncio.run(check_documentation_json('http://127.0.0.1:8000')) # doctest: +SKIP
         {'status': 'success', 'message': 'REST API JSON documentation found at http://127.0.0.1:8000/', 'response': '{...}'}
     """
-    _errors = set()
-    url = uri.rstrip('/')
-
-    api_terms = [
-        'swagger',
-        'openapi',
-        'endpoints',
-        'paths',
-        'documentation',
-    ]
+    if client is None:
+        async with open_client() as client:
+            return await check_documentation_json(
+                uri, doc_endpoint, client, cache_ttl, use_cache
+            )
 
     if doc_endpoint:
         doc_endpoint = doc_endpoint.lstrip('/')
+
+    if not use_cache or not is_default_client(client):
+        return await _discover_documentation(
+            uri, doc_endpoint, client, None, cache_ttl
+        )
+
+    cache_key = (uri.rstrip('/'), doc_endpoint)
+    cached = await _cached_documentation(cache_key, client, cache_ttl)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    discovery = _documentation_discoveries.get(cache_key)
+    if discovery is None or discovery.get_loop() is not loop:
+        discovery = loop.create_task(
+            _discover_documentation(
+                uri, doc_endpoint, client, cache_key, cache_ttl
+            )
+        )
+        _documentation_discoveries[cache_key] = discovery
+
+        def forget_discovery(task):
+            if _documentation_discoveries.get(cache_key) is task:
+                del _documentation_discoveries[cache_key]
+
+        discovery.add_done_callback(forget_discovery)
+
+    return await asyncio.shield(discovery)
+
+
+async def _discover_documentation(
+    uri: str,
+    doc_endpoint: str,
+    client: httpx.AsyncClient,
+    cache_key: tuple,
+    cache_ttl: float,
+) -> dict:
+    """Probe the documentation endpoints of the given base URI, as described in check_documentation_json.
+
+    Parameters:
+        uri (str): The base URI of the API.
+        doc_endpoint (str): The endpoint where the documentation is available, or None to try the usual ones.
+        client (httpx.AsyncClient): The HTTP client used to send the requests.
+        cache_key (tuple): The key under which a JSON documentation found is cached, or None to not cache it.
+        cache_ttl (float): The number of seconds a found documentation is reused without revalidation.
+
+    Returns:
+        dict: A dictionary containing the 'status', 'message', and 'response' keys detailing the outcome of the check.
+    """
+    _errors = []
+    url = uri.rstrip('/')
+
+    if doc_endpoint:
         endpoints = [doc_endpoint]
+        probes = [_is_json_rest_api(f'{url}/{doc_endpoint}', client)]
     else:
-        endpoints = [
-            'openapi.json',
-            'swagger.json',
-            'docs',
-            'api-docs',
-            'swagger',
-            'redoc',
-            'api/docs',
-            'swagger/ui',
-            '',
+        endpoint_hits = _load_endpoint_hits()
+        endpoints = sorted(
+            _DOCUMENTATION_ENDPOINTS,
+            key=lambda endpoint: endpoint_hits.get(endpoint, 0),
+            reverse=True,
+        )
+        probes = [
+            asyncio.create_task(
+                _is_json_rest_api(f'{url}/{endpoint}', client, head_first=True)
+            )
+            for endpoint in endpoints
         ]
 
-    for endpoint in endpoints:
-        full_url = f'{url}/{endpoint}'
-        try:
-            is_rest, response = await _is_json_rest_api(full_url)
-
-            if not is_rest and doc_endpoint:
-                _errors.add(
-                    f'The URL {full_url} does not seem to be a JSON REST API'
-                )
-
-            if not response and not doc_endpoint:
-                _errors.add(
-                    f'The base URL provided ({uri}) does not seem to be a JSON REST API. Try specifying the documentation endpoint'
-                )
+    try:
+        for endpoint, probe in zip(endpoints, probes):
+            full_url = f'{url}/{endpoint}'
+            try:
+                is_rest, response = await probe
+
+                if not is_rest and doc_endpoint:
+                    _errors.append(
+                        f'The URL {full_url} does not seem to be a JSON REST API'
+                    )
 
-            if response and response.status_code // 100 != 2 and doc_endpoint:
-                _errors.add(
-                    f'{response.status_code} Client Error: {response.reason_phrase} for url: {response.url}'
-                )
+                if not response and not doc_endpoint:
+                    _errors.append(
+                        f'The base URL provided ({uri}) does not seem to be a JSON REST API. Try specifying the documentation endpoint'
+                    )
 
-            if response and any(
-                term in response.text.lower() for term in api_terms
-            ):
-                if 'application/json' in response.headers.get(
-                    'Content-Type', ''
+                if (
+                    response
+                    and response.status_code // 100 != 2
+                    and doc_endpoint
                 ):
-                    return {
-                        'status': 'success',
-                        'message': f'REST API JSON documentation found at {full_url}',
-                        'response': response.json(),
-                    }
-                elif response.status_code // 100 == 2:
-                    message = f'Potential REST API documentation found at {full_url}, but not in JSON format'
-                    if not doc_endpoint:
-                        message += ' (Endpoint not specified, please provide the JSON documentation endpoint)'
-                    return {
-                        'status': 'warning',
-                        'message': message,
-                        'response': response.text,
-                    }
-
-        except Exception as e:
-            if doc_endpoint:
-                _errors.add(
-                    f'An error occurred while requesting {full_url}: {e}'
-                )
-            else:
-                _errors.add(
-                    f'An error occurred while requesting {uri}: Endpoint not specified, and we could not identify it with the base URL alone. Please provide the JSON documentation endpoint'
-                )
+                    _errors.append(
+                        f'{response.status_code} Client Error: {response.reason_phrase} for url: {response.url}'
+                    )
+
+                if response and _has_documentation_terms(response):
+                    if _is_json(response):
+                        result = _json_documentation(full_url, response)
+                        if cache_key is not None:
+                            _cache_documentation(
+                                cache_key,
+                                full_url,
+                                response,
+                                result,
+                                cache_ttl,
+                            )
+                        if not doc_endpoint:
+                            endpoint_hits[endpoint] = (
+                                endpoint_hits.get(endpoint, 0) + 1
+                            )
+                        return result
+                    elif response.status_code // 100 == 2:
+                        message = f'Potential REST API documentation found at {full_url}, but not in JSON format'
+                        if not doc_endpoint:
+                            message += ' (Endpoint not specified, please provide the JSON documentation endpoint)'
+                        return {
+                            'status': 'warning',
+                            'message': message,
+                            'response': response.text,
+                        }
+
+            except Exception as e:
+                if doc_endpoint:
+                    _errors.append(
+                        f'An error occurred while requesting {full_url}: {e}'
+                    )
+                else:
+                    _errors.append(
+                        f'An error occurred while requesting {uri}: Endpoint not specified, and we could not identify it with the base URL alone. Please provide the JSON documentation endpoint'
+                    )
+    finally:
+        if not doc_endpoint:
+            for probe in probes:
+                probe.cancel()
+            await asyncio.gather(*probes, return_exceptions=True)
 
     message = 'No REST API documentation found'
 
@@ -155,15 +578,18 @@ async def check_documentation_json(uri: str, doc_endpoint: str = None) -> dict:
     return {
         'status': 'error',
         'message': message,
-        'response': list(_errors),
+        'response': list(dict.fromkeys(_errors)),
     }
 
 
-async def _supports_https(uri: str) -> dict:
+async def _supports_https(uri: str, client: httpx.AsyncClient = None) -> dict:
     """Check if the given base URI of an API has support to HTTPS protocol.
 
+    Only the status line and headers of the HTTPS response are read; the body is never downloaded.
+
     Parameters:
         uri (str): The base URI of the API.
+        client (httpx.AsyncClient, optional): The HTTP client used to send the request. Defaults to the client of apilyzer.http.open_client.
 
     Returns:
         dict: A dictionary containing the 'status', 'message', and 'response' keys detailing the outcome of the check.
@@ -171,7 +597,7 @@ async def _supports_https(uri: str) -> dict:
     Examples:
         >>> import asyncio
         >>> asyncio.run(_supports_https('http://127.0.0.1:8000')) # doctest: +SKIP
-        {'status': 'success', 'message': '✅ The URI does not support HTTPS at http://127.0.0.1:8000/. ', 'response': '{...}'}
+        {'status': 'success', 'message': '✅ The URI supports HTTPS at http://127.0.0.1:8000', 'response': '200 OK (application/json)'}
     """
 
     https_uri = (
@@ -180,35 +606,38 @@ async def _supports_https(uri: str) -> dict:
         else uri
     )
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        _errors = set()
-        try:
-            response = await client.get(https_uri)
-            if response.status_code // 100 == 2:
-                if 'application/json' in response.headers.get(
-                    'Content-Type', ''
-                ):
-                    _response = response.json()
-                else:
-                    _response = response.text
-                return {
-                    'status': 'success',
-                    'message': f'✅ The URI supports HTTPS at {uri}',
-                    'response': _response,
-                }
-            else:
-                _errors.add(
-                    f'{response.status_code} Client Error: {response.reason_phrase} for URL: {https_uri}'
-                )
-        except httpx.RequestError as exc:
-            _errors.add(
-                f'An error occurred while requesting {https_uri}: {exc}'
+    if client is None:
+        async with open_client() as client:
+            return await _supports_https(uri, client)
+
+    _errors = []
+    try:
+        response = await client.send(
+            client.build_request('GET', https_uri),
+            follow_redirects=False,
+            stream=True,
+        )
+        await response.aclose()
+        if response.status_code // 100 == 2:
+            content_type = response.headers.get('Content-Type', '')
+            return {
+                'status': 'success',
+                'message': f'✅ The URI supports HTTPS at {uri}',
+                'response': f'{response.status_code} {response.reason_phrase} ({content_type})',
+            }
+        else:
+            _errors.append(
+                f'{response.status_code} Client Error: {response.reason_phrase} for URL: {https_uri}'
             )
+    except httpx.RequestError as exc:
+        _errors.append(
+            f'An error occurred while requesting {https_uri}: {exc}'
+        )
 
     return {
         'status': 'error',
         'message': f'🚫 The URI does not support HTTPS at {uri}',
-        'response': list(_errors),
+        'response': _errors,
     }
 
 
@@ -223,30 +652,14 @@ async def _verify_maturity_paths(paths: dict) -> dict:
     """
     feedback = {}
     messages = []
+    add_message = messages.append
     _has_only_post_method = True
-    expected_responses = {
-        'get': {
-            '200': 'OK',
-        },
-        'post': {
-            '201': 'Created',
-        },
-        'put': {
-            '200': 'OK',
-        },
-        'patch': {
-            '200': 'OK',
-        },
-        'delete': {
-            '200': 'OK',
-        },
-    }
-    valid_methods = set(expected_responses.keys())
 
     for path, path_info in paths.items():
         for method, method_info in path_info.items():
-            if method not in valid_methods:
-                messages.append(
+            expected_responses = _EXPECTED_RESPONSES.get(method)
+            if expected_responses is None:
+                add_message(
                     f'🚫   Alert! The {path} path uses a non-conventional {method.upper()} method.'
                     f' Consider following the standard RESTful methods for better maturity.'
                 )
@@ -255,28 +668,26 @@ async def _verify_maturity_paths(paths: dict) -> dict:
             if method != 'post':
                 _has_only_post_method = False
 
-            responses = method_info.get('responses', {})
-            for status, expected_description in expected_responses.get(
-                method, {}
-            ).items():
-                actual_description = responses.get(status, {}).get(
-                    'description'
-                )
+            method_upper = method.upper()
+            path_method = f'{path} path for {method_upper} requests'
+            responses = method_info.get('responses') or _NO_RESPONSES
+            for status, expected_description in expected_responses.items():
                 if status in responses:
+                    actual_description = responses[status].get('description')
                     if actual_description == expected_description:
-                        messages.append(
-                            f'✅   Congratulations! The {path} path for {method.upper()} requests returns the correct status code ({status}) and description'
+                        add_message(
+                            f'✅   Congratulations! The {path_method} returns the correct status code ({status}) and description'
                         )
                     else:
-                        messages.append(
-                            f'✅   Congratulations! The {path} method returns the correct status code for {method.upper()} requests'
+                        add_message(
+                            f'✅   Congratulations! The {path} method returns the correct status code for {method_upper} requests'
                         )
-                        messages.append(
-                            f'⚠️   Warning! The {path} path for {method.upper()} requests should return the description "{expected_description}" for the {status} status code, but it returns "{actual_description}" instead'
+                        add_message(
+                            f'⚠️   Warning! The {path_method} should return the description "{expected_description}" for the {status} status code, but it returns "{actual_description}" instead'
                         )
                 else:
-                    messages.append(
-                        f'🚫   Error! The {path} path for {method.upper()} requests is missing the expected {status} status code'
+                    add_message(
+                        f'🚫   Error! The {path_method} is missing the expected {status} status code'
                     )
 
     if _has_only_post_method:
@@ -292,64 +703,104 @@ async def _verify_maturity_paths(paths: dict) -> dict:
     return feedback
 
 
-async def analyze_api_maturity(uri: str, doc_endpoint: str = None) -> dict:
+async def analyze_api_maturity(
+    uri: str,
+    doc_endpoint: str = None,
+    client: httpx.AsyncClient = None,
+    check_https: bool = True,
+    use_cache: bool = True,
+) -> dict:
     """Analyze the maturity level of a REST API using Richardson's maturity model.
 
+    The HTTPS support check runs concurrently with the documentation discovery, and is cancelled and awaited if no documentation is found, so it never outlives the call.
+
     Parameters:
         uri (str): The base URI of the API.
         doc_endpoint (str, optional): The endpoint where the documentation is available. Defaults to None.
+        client (httpx.AsyncClient, optional): The HTTP client used to send the requests. Defaults to the client of apilyzer.http.open_client.
+        check_https (bool, optional): Whether to check if the API supports HTTPS. Defaults to True.
+        use_cache (bool, optional): Whether to reuse a cached documentation of the API. Defaults to True.
 
     Returns:
         dict: A dictionary containing feedback on the API's maturity level according to Richardson's maturity model.
     """
+    if client is None:
+        async with open_client() as client:
+            return await analyze_api_maturity(
+                uri, doc_endpoint, client, check_https, use_cache
+            )
+
     feedbacks = {}
 
-    swagger_doc = await check_documentation_json(uri, doc_endpoint)
+    https_check = None
+    if check_https:
+        https_check = asyncio.create_task(_supports_https(uri, client))
 
-    if swagger_doc['status'] == 'error':
-        return swagger_doc
+    try:
+        swagger_doc = await check_documentation_json(
+            uri, doc_endpoint, client, use_cache=use_cache
+        )
+
+        if swagger_doc['status'] == 'error':
+            return swagger_doc
 
-    response = swagger_doc['response']
+        response = swagger_doc['response']
+
+        if isinstance(response, str):
+            try:
+                response = orjson.loads(response)
+
+            except orjson.JSONDecodeError:
+                return {
+                    'status': 'error',
+                    'message': f'The API is documented, but the documentation is not valid JSON. Please check the documentation at {uri}',
+                    'check_swagger_response': swagger_doc,
+                }
 
-    if isinstance(response, str):
         try:
-            response = json.loads(response)
+            paths = response.get('paths', {})
 
-        except json.JSONDecodeError:
+        except AttributeError:
             return {
                 'status': 'error',
-                'message': f'The API is documented, but the documentation is not valid JSON. Please check the documentation at {uri}',
+                'message': 'The API is documented, but no paths were found',
                 'check_swagger_response': swagger_doc,
             }
 
-    try:
-        paths = response.get('paths', {})
-
-    except AttributeError:
-        return {
-            'status': 'error',
-            'message': 'The API is documented, but no paths were found',
-            'check_swagger_response': swagger_doc,
-        }
+        feedback = await _verify_maturity_paths(paths)
 
-    feedback = await _verify_maturity_paths(paths)
-    https = await _supports_https(uri)
+        status = 'success' if feedback['messages'] else 'error'
 
-    status = 'success' if feedback['messages'] else 'error'
+        feedbacks['status'] = status
+        if https_check is not None:
+            https = await https_check
+            feedbacks['https'] = https['message']
+        feedbacks['feedback'] = feedback
 
-    feedbacks['status'] = status
-    feedbacks['https'] = https['message']
-    feedbacks['feedback'] = feedback
+        return feedbacks
 
-    return feedbacks
+    finally:
+        if https_check is not None:
+            https_check.cancel()
+            await asyncio.gather(https_check, return_exceptions=True)
 
 
-async def estimate_rate_limit(uri: str, max_requests: int) -> dict:
+async def estimate_rate_limit(
+    uri: str,
+    max_requests: int,
+    client: httpx.AsyncClient = None,
+    concurrency: int = 50,
+) -> dict:
     """Analyze the rate limit of a REST API using multiple requests in parallel.
 
+    At most `concurrency` requests are in flight at the same time, and the analysis stops at the first 429 or request error.
+    Response bodies are read and discarded so their connections return to the pool; bodies over 64 KiB are abandoned, closing their connection.
+
     Parameters:
         uri (str): The base URI of the API.
         max_requests (int): The max quantity of requests the users want to test.
+        client (httpx.AsyncClient, optional): The HTTP client used to send the requests. Defaults to the client of apilyzer.http.open_client.
+        concurrency (int, optional): The max quantity of requests sent at the same time. Defaults to 50.
 
     Returns:
         dict: A dictionary containing feedback on how the API was able to support multiple parallel requests.
@@ -361,32 +812,53 @@ async def estimate_rate_limit(uri: str, max_requests: int) -> dict:
     """
 
     async def make_request(session, uri):
-        try:
-            response = await session.get(uri)
-            if response.status_code == 429:
+        async with semaphore:
+            try:
+                async with session.stream(
+                    'GET', uri, follow_redirects=False
+                ) as response:
+                    status_code = response.status_code
+                    received = 0
+                    async for chunk in response.aiter_bytes():
+                        received += len(chunk)
+                        if received > _RATE_LIMIT_BODY_BYTES:
+                            break
+            except httpx.RequestError as exc:
                 return {
                     'status': 'error',
-                    'message': f'The API returned a 429 error (too many requests). This indicates that the rate limit has been exceeded',
+                    'message': f'An error occurred while requesting {uri}: {exc}',
                 }
-            return {
-                'status': 'success',
-                'message': 'All requests were successful',
-            }
-        except httpx.RequestError as exc:
+        if status_code == 429:
             return {
                 'status': 'error',
-                'message': f'An error occurred while requesting {uri}: {exc}',
+                'message': f'The API returned a 429 error (too many requests). This indicates that the rate limit has been exceeded',
             }
+        return {
+            'status': 'success',
+            'message': 'All requests were successful',
+        }
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        tasks = []
-        for _ in range(max_requests):
-            tasks.append(make_request(client, uri))
-        results = await asyncio.gather(*tasks)
+    if client is None:
+        async with open_client() as client:
+            return await estimate_rate_limit(
+                uri, max_requests, client, concurrency
+            )
 
-        for result in results:
+    semaphore = asyncio.Semaphore(max(1, min(max_requests, concurrency)))
+    tasks = [
+        asyncio.create_task(make_request(client, uri))
+        for _ in range(max_requests)
+    ]
+
+    try:
+        for task in asyncio.as_completed(tasks):
+            result = await task
             if result['status'] == 'error':
                 return result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     return {
         'status': 'success',
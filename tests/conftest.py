@@ -0,0 +1,26 @@
+from collections import OrderedDict
+
+import pytest
+
+from apilyzer import verify
+from apilyzer.http import close_client, get_client
+
+
+@pytest.fixture(autouse=True)
+def isolated_endpoint_hits(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        verify, '_ENDPOINT_HITS_PATH', tmp_path / 'endpoint_hits.json'
+    )
+    monkeypatch.setattr(verify, '_endpoint_hits', None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_documentation_cache(monkeypatch):
+    monkeypatch.setattr(verify, '_documentation_cache', OrderedDict())
+    monkeypatch.setattr(verify, '_documentation_discoveries', {})
+
+
+@pytest.fixture(scope='session')
+async def client():
+    yield get_client()
+    await close_client()
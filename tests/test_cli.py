@@ -1,94 +1,100 @@
+import asyncio
+
+import pytest
+import respx
 from typer.testing import CliRunner
 
-from apilyzer.cli import app
+from apilyzer.cli import _run, app
 
 runner = CliRunner()
 
-
-def test_main():
-    result = runner.invoke(app)
-    assert result.exit_code == 0
-
-
-def test_cli_returns_success():
-    result = runner.invoke(app, ['--help'])
+PICPAY_DOC_URL = 'https://picpay.github.io/picpay-docs-digital-payments/swagger/checkout.json'
+SWAGGER_DOC = {
+    'swagger': '2.0',
+    'paths': {
+        '/payments': {
+            'post': {'responses': {'201': {'description': 'Created'}}},
+        },
+        '/payments/{id}': {
+            'get': {'responses': {'200': {'description': 'OK'}}},
+        },
+    },
+}
+
+
+@pytest.mark.parametrize('args', [[], ['--help']], ids=['no_args', 'help'])
+def test_main(args):
+    result = runner.invoke(app, args)
     assert result.exit_code == 0
 
 
-def test_cli_verify_rest_return_success_with_flag():
-    result = runner.invoke(
-        app,
-        [
-            'verify-rest',
-            'https://petstore.swagger.io',
-            '--doc-endpoint',
-            'v2/swagger',
-        ],
+@pytest.mark.parametrize('option', ['--doc-endpoint', '-e'])
+@respx.mock
+def test_cli_verify_rest_return_success_with_doc_endpoint(option):
+    respx.get('https://petstore.swagger.io/v2/swagger').respond(
+        200, json=SWAGGER_DOC
     )
-    "'status': 'success'" in result.stdout
-
 
-def test_cli_verify_rest_return_success_with_alias():
     result = runner.invoke(
         app,
-        ['verify-rest', 'https://petstore.swagger.io', '-e', 'v2/swagger'],
+        ['verify-rest', 'https://petstore.swagger.io', option, 'v2/swagger'],
     )
-    "'status': 'success'" in result.stdout
+    assert "'status': 'success'" in result.stdout
 
 
+@respx.mock
 def test_cli_verify_rest_return_success_without_flag():
-    result = runner.invoke(
-        app, ['verify-rest', 'https://petstore.swagger.io/v2/swagger']
+    respx.route(url='https://petstore.swagger.io/v2/swagger').respond(
+        200, json=SWAGGER_DOC
     )
-    "'status': 'success'" in result.stdout
+    respx.route(host='petstore.swagger.io').respond(404)
 
-
-def test_cli_verify_maturity_return_success_with_flag():
     result = runner.invoke(
-        app,
-        [
-            'verify-maturity',
-            'https://picpay.github.io',
-            '--doc-endpoint',
-            'picpay-docs-digital-payments/swagger/checkout.json',
-        ],
+        app, ['verify-rest', 'https://petstore.swagger.io/v2/swagger']
     )
-    "'status': 'success'" in result.stdout
+    assert "'status': 'success'" in result.stdout
 
 
-def test_cli_verify_matutiry_return_success_with_alias():
+@pytest.mark.parametrize('option', ['--doc-endpoint', '-e'])
+@respx.mock
+def test_cli_verify_maturity_return_success_with_doc_endpoint(option):
+    respx.route(url=PICPAY_DOC_URL).respond(200, json=SWAGGER_DOC)
+    respx.route(host='picpay.github.io').respond(200)
+
     result = runner.invoke(
         app,
         [
             'verify-maturity',
             'https://picpay.github.io',
-            '-e',
+            option,
             'picpay-docs-digital-payments/swagger/checkout.json',
         ],
     )
-    "'status': 'success'" in result.stdout
+    assert "'status': 'success'" in result.stdout
 
 
+@respx.mock
 def test_cli_verify_maturity_return_success_without_flag():
-    result = runner.invoke(
-        app,
-        [
-            'verify-maturity',
-            'https://picpay.github.io/picpay-docs-digital-payments/swagger/checkout.json',
-        ],
-    )
-    "'status': 'success'" in result.stdout
+    respx.route(url=PICPAY_DOC_URL).respond(200, json=SWAGGER_DOC)
+    respx.route(host='picpay.github.io').respond(404)
 
+    result = runner.invoke(app, ['verify-maturity', PICPAY_DOC_URL])
+    assert "'status': 'success'" in result.stdout
 
-def test_cli_test_rate_return_success_default_arg():
-    result = runner.invoke(
-        app, ['test-rate', 'https://petstore.swagger.io/v2/pet']
-    )
-    "'status': 'success'" in result.stdout
 
+@pytest.mark.parametrize('rate', [[], ['50']], ids=['default', 'with_arg'])
+@respx.mock
+def test_cli_test_rate_return_success(rate):
+    respx.get('https://petstore.swagger.io/v2/pet').respond(200)
 
-def test_cli_test_rate_return_success_with_arg():
     result = runner.invoke(
-        app, ['test-rate', 'https://petstore.swagger.io/v2/pet', '50']
+        app, ['test-rate', 'https://petstore.swagger.io/v2/pet', *rate]
     )
-    "'status': 'success'" in result.stdout
+    assert "'status': 'success'" in result.stdout
+
+
+def test_run_reuses_event_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert _run(current_loop()) is _run(current_loop())
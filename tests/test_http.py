@@ -0,0 +1,67 @@
+import asyncio
+
+from apilyzer.http import close_client, get_client, open_client
+
+
+def test_get_client_returns_shared_client():
+    async def main():
+        return get_client(), get_client()
+
+    first, second = asyncio.run(main())
+
+    assert first is second
+
+
+def test_get_client_new_client_after_close():
+    async def main():
+        first = get_client()
+        await close_client()
+        return first, get_client()
+
+    first, second = asyncio.run(main())
+
+    assert first.is_closed
+    assert first is not second
+
+
+def test_get_client_new_client_per_event_loop():
+    async def main():
+        return get_client()
+
+    first = asyncio.run(main())
+    second = asyncio.run(main())
+
+    assert first is not second
+
+
+def test_get_client_prefers_json():
+    async def main():
+        return get_client()
+
+    client = asyncio.run(main())
+
+    assert client.headers['Accept'].startswith('application/json')
+
+
+def test_open_client_reuses_client_of_running_loop():
+    async def main():
+        shared = get_client()
+        async with open_client() as client:
+            pass
+        return shared, client
+
+    shared, client = asyncio.run(main())
+
+    assert client is shared
+    assert not client.is_closed
+
+
+def test_open_client_closes_new_client():
+    async def main():
+        async with open_client() as client:
+            pass
+        return client
+
+    client = asyncio.run(main())
+
+    assert client.is_closed
@@ -1,52 +1,366 @@
 import asyncio
+import gzip
 
+import httpx
+import orjson
+import pytest
+import respx
+
+from apilyzer import verify
 from apilyzer.verify import (
     _is_json_rest_api,
     _supports_https,
+    _verify_maturity_paths,
     analyze_api_maturity,
     check_documentation_json,
     estimate_rate_limit,
 )
 
+HTML_PAGE = '<html><body>Search</body></html>'
+PETSTORE_DOC_URL = 'https://petstore.swagger.io/v2/swagger.json'
+PICPAY_DOC_URL = 'https://picpay.github.io/picpay-docs-digital-payments/swagger/checkout.json'
+SWAGGER_DOC = {
+    'swagger': '2.0',
+    'paths': {
+        '/pet': {
+            'post': {'responses': {'201': {'description': 'Created'}}},
+            'put': {'responses': {'200': {'description': 'OK'}}},
+        },
+        '/pet/{petId}': {
+            'get': {'responses': {'200': {'description': 'OK'}}},
+            'delete': {'responses': {'200': {'description': 'OK'}}},
+        },
+    },
+}
+
+google_mock = respx.mock(assert_all_called=False)
+google_mock.route(host='google.com', path='/').respond(200, html=HTML_PAGE)
+google_mock.route(host='google.com').respond(404, html=HTML_PAGE)
+
+petstore_mock = respx.mock(assert_all_called=False)
+petstore_mock.route(url=PETSTORE_DOC_URL).respond(200, json=SWAGGER_DOC)
+petstore_mock.route(host='petstore.swagger.io').respond(404)
+
+unreachable_mock = respx.mock(assert_all_called=False)
+unreachable_mock.route(host='invalid_url').mock(side_effect=httpx.ConnectError)
+unreachable_mock.route(host='invalid_url.com').mock(
+    side_effect=httpx.ConnectError
+)
+unreachable_mock.route(host='api-with-request-error.com').mock(
+    side_effect=httpx.ConnectError
+)
 
-def test_is_json_rest_api_true():
-    is_rest, response = asyncio.run(
-        _is_json_rest_api(
-            'https://picpay.github.io/picpay-docs-digital-payments/swagger/checkout.json'
-        )
-    )
+
+@respx.mock
+async def test_is_json_rest_api_true(client):
+    respx.get(PICPAY_DOC_URL).respond(200, json=SWAGGER_DOC)
+
+    is_rest, response = await _is_json_rest_api(PICPAY_DOC_URL, client=client)
 
     assert is_rest is True
     assert response is not None
 
 
-def test_is_json_rest_api_false():
-    is_rest, response = asyncio.run(_is_json_rest_api('http://google.com'))
+@google_mock
+async def test_is_json_rest_api_false(client):
+    is_rest, response = await _is_json_rest_api(
+        'http://google.com', client=client
+    )
 
     assert is_rest is False
     assert response.status_code == 200
     assert 'text/html' in response.headers['content-type']
 
 
-def test_url_is_json_rest_api_invalid():
-    is_rest, response = asyncio.run(_is_json_rest_api('https://invalid_url'))
+async def test_is_json_rest_api_head_first_skips_missing_body():
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        return httpx.Response(404, text='Not Found')
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        is_rest, response = await _is_json_rest_api(
+            'http://127.0.0.1:8000/openapi.json', client, head_first=True
+        )
 
     assert is_rest is False
-    assert response is None
+    assert response.status_code == 404
+    assert methods == ['HEAD']
+
+
+async def test_is_json_rest_api_head_first_skips_binary_body():
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        return httpx.Response(
+            200, headers={'Content-Type': 'image/png'}, content=b'\x89PNG'
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        is_rest, response = await _is_json_rest_api(
+            'http://127.0.0.1:8000/docs', client, head_first=True
+        )
+
+    assert is_rest is False
+    assert response.status_code == 200
+    assert methods == ['HEAD']
+
+
+async def test_check_documentation_json_yaml_doc():
+    def handler(request):
+        if request.url.path != '/api-docs':
+            return httpx.Response(404)
+        return httpx.Response(
+            200,
+            headers={'Content-Type': 'application/yaml'},
+            text='' if request.method == 'HEAD' else 'openapi: 3.0.0\n',
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', client=client
+        )
+
+    assert result['status'] == 'warning'
+    assert (
+        'Potential REST API documentation found at http://127.0.0.1:8000/api-docs, but not in JSON format'
+        in result['message']
+    )
+
+
+async def test_is_json_rest_api_head_first_falls_back_to_get():
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        if request.method == 'HEAD':
+            return httpx.Response(405)
+        return httpx.Response(200, json={'paths': {}})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        is_rest, response = await _is_json_rest_api(
+            'http://127.0.0.1:8000/openapi.json', client, head_first=True
+        )
+
+    assert is_rest is True
+    assert methods == ['HEAD', 'GET']
+
+
+async def test_is_json_rest_api_allow_methods_header():
+    def handler(request):
+        methods = 'GETS' if request.url.path == '/typo' else 'GET, POST'
+        return httpx.Response(
+            200,
+            text='<html></html>',
+            headers={'Access-Control-Allow-Methods': methods},
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        is_rest, _ = await _is_json_rest_api(
+            'http://127.0.0.1:8000/api', client
+        )
+        is_typo_rest, _ = await _is_json_rest_api(
+            'http://127.0.0.1:8000/typo', client
+        )
+
+    assert is_rest is True
+    assert is_typo_rest is False
+
+
+async def test_is_json_rest_api_json_content_type_with_html_body():
+    def handler(request):
+        return httpx.Response(
+            200,
+            text='<html>Not Found</html>',
+            headers={'Content-Type': 'application/json'},
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        is_rest, response = await _is_json_rest_api(
+            'http://127.0.0.1:8000', client
+        )
+
+    assert is_rest is False
+    assert response.status_code == 200
+
+
+async def test_check_documentation_json_utf8_bom():
+    def handler(request):
+        return httpx.Response(
+            200,
+            headers={'Content-Type': 'application/json'},
+            content=b'\xef\xbb\xbf{"openapi": "3.0.0", "paths": {}}',
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', 'openapi.json', client=client
+        )
+
+    assert result['status'] == 'success'
+    assert result['response'] == {'openapi': '3.0.0', 'paths': {}}
+
 
+async def test_check_documentation_json_errors_in_order():
+    def handler(request):
+        return httpx.Response(404, text='Not Found')
 
-def test_is_json_rest_api_no_http():
-    is_rest, response = asyncio.run(
-        _is_json_rest_api('petstore.swagger.io/v2/swagger')
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', 'openapi.json', client=client
+        )
+
+    assert result['response'] == [
+        'The URL http://127.0.0.1:8000/openapi.json does not seem to be a JSON REST API',
+        '404 Client Error: Not Found for url: http://127.0.0.1:8000/openapi.json',
+    ]
+
+
+async def test_check_documentation_json_body_size_limit(monkeypatch):
+    monkeypatch.setattr(verify, '_MAX_RESPONSE_BYTES', 64)
+
+    async def body():
+        yield b'{"openapi": "3.0.0", "paths": {}, "padding": "'
+        yield b'x' * 64
+        yield b'"}'
+
+    def handler(request):
+        return httpx.Response(
+            200, headers={'Content-Type': 'application/json'}, content=body()
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', 'openapi.json', client=client
+        )
+
+    assert result['status'] == 'error'
+    assert (
+        'An error occurred while requesting http://127.0.0.1:8000/openapi.json: The response body exceeds 64 bytes'
+        in result['response']
+    )
+
+
+async def test_check_documentation_json_decoded_size_limit(monkeypatch):
+    monkeypatch.setattr(verify, '_MAX_RESPONSE_BYTES', 64 * 1024)
+    compressed = gzip.compress(
+        b'{"openapi": "3.0.0", "padding": "' + b'x' * 1024 * 1024 + b'"}'
+    )
+
+    async def body():
+        yield compressed
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            headers={
+                'Content-Type': 'application/json',
+                'Content-Encoding': 'gzip',
+            },
+            content=body(),
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', 'openapi.json', client=client
+        )
+
+    assert len(compressed) < 64 * 1024
+    assert result['status'] == 'error'
+    assert (
+        'An error occurred while requesting http://127.0.0.1:8000/openapi.json: The response body exceeds 65536 bytes'
+        in result['response']
+    )
+
+
+async def test_check_documentation_json_terms_scan_limit(monkeypatch):
+    monkeypatch.setattr(verify, '_API_TERMS_SCAN_BYTES', 32)
+
+    def handler(request):
+        return httpx.Response(200, html=f'<html>{"x" * 32}Swagger UI</html>')
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', 'docs', client=client
+        )
+
+    assert result['status'] == 'error'
+
+
+@pytest.mark.parametrize(
+    'cors_headers',
+    [{}, {'Access-Control-Allow-Methods': 'GET, POST'}],
+    ids=['plain', 'cors'],
+)
+async def test_check_documentation_json_sorted_keys_spec(cors_headers):
+    spec = {
+        **SWAGGER_DOC,
+        'definitions': {
+            f'Model{index}': {'type': 'object', 'title': 'x' * 100}
+            for index in range(4000)
+        },
+    }
+    body = orjson.dumps(spec, option=orjson.OPT_SORT_KEYS)
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            headers={'Content-Type': 'application/json', **cors_headers},
+            content=body,
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', 'swagger.json', client=client
+        )
+
+    assert body.index(b'"paths"') > verify._API_TERMS_SCAN_BYTES
+    assert result['status'] == 'success'
+    assert result['response']['swagger'] == '2.0'
+
+
+@unreachable_mock
+async def test_url_is_json_rest_api_invalid(client):
+    is_rest, response = await _is_json_rest_api(
+        'https://invalid_url', client=client
     )
 
     assert is_rest is False
     assert response is None
 
 
-def test_is_json_rest_api_no_json():
-    is_rest, response = asyncio.run(
-        _is_json_rest_api('http://rss.cnn.com/rss/cnn_topstories.rss')
+@pytest.mark.parametrize(
+    'uri', ['petstore.swagger.io/v2/swagger', 'httpbin.org/json']
+)
+async def test_is_json_rest_api_no_http(uri):
+    is_rest, response = await _is_json_rest_api(uri)
+
+    assert is_rest is False
+    assert response is None
+
+
+@respx.mock
+async def test_is_json_rest_api_no_json(client):
+    respx.get('http://rss.cnn.com/rss/cnn_topstories.rss').respond(
+        200, text='<rss></rss>', headers={'Content-Type': 'text/xml'}
+    )
+
+    is_rest, response = await _is_json_rest_api(
+        'http://rss.cnn.com/rss/cnn_topstories.rss', client=client
     )
 
     assert is_rest is False
@@ -54,11 +368,10 @@ def test_is_json_rest_api_no_json():
     assert 'text/xml' in response.headers['content-type']
 
 
-def test_check_documentation_json_success_doc():
-    result = asyncio.run(
-        check_documentation_json(
-            'https://petstore.swagger.io/v2', 'swagger.json'
-        )
+@petstore_mock
+async def test_check_documentation_json_success_doc(client):
+    result = await check_documentation_json(
+        'https://petstore.swagger.io/v2', 'swagger.json', client=client
     )
     assert result['status'] == 'success'
     assert (
@@ -68,9 +381,10 @@ def test_check_documentation_json_success_doc():
     assert 'swagger' in result['response'] or 'openapi' in result['response']
 
 
-def test_check_documentation_json_success_no_doc():
-    result = asyncio.run(
-        check_documentation_json('https://petstore.swagger.io/v2')
+@petstore_mock
+async def test_check_documentation_json_success_no_doc(client):
+    result = await check_documentation_json(
+        'https://petstore.swagger.io/v2', client=client
     )
     assert result['status'] == 'success'
     assert (
@@ -80,9 +394,251 @@ def test_check_documentation_json_success_no_doc():
     assert 'swagger' in result['response'] or 'openapi' in result['response']
 
 
-def test_check_documentation_json_no_api_doc():
-    result = asyncio.run(
-        check_documentation_json('https://google.com', 'swagger.json')
+async def test_check_documentation_json_prefers_first_endpoint_found():
+    async def handler(request):
+        if request.url.path in ('/swagger.json', '/docs'):
+            await asyncio.sleep(
+                0.05 if request.url.path == '/swagger.json' else 0
+            )
+            return httpx.Response(200, json={'swagger': '2.0', 'paths': {}})
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', client=client
+        )
+
+    assert result['status'] == 'success'
+    assert (
+        'REST API JSON documentation found at http://127.0.0.1:8000/swagger.json'
+        in result['message']
+    )
+
+
+async def test_check_documentation_json_parses_documentation_once(monkeypatch):
+    loads = orjson.loads
+    parsed = []
+
+    def counting_loads(content):
+        parsed.append(content)
+        return loads(content)
+
+    monkeypatch.setattr(verify.orjson, 'loads', counting_loads)
+
+    def handler(request):
+        return httpx.Response(200, json={'openapi': '3.0.0', 'paths': {}})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', 'openapi.json', client=client
+        )
+
+    assert result['response'] == {'openapi': '3.0.0', 'paths': {}}
+    assert len(parsed) == 1
+
+
+async def test_check_documentation_json_prefers_previous_hits():
+    verify._endpoint_hits = {'redoc': 3}
+
+    def handler(request):
+        if request.url.path in ('/openapi.json', '/redoc'):
+            return httpx.Response(200, json={'openapi': '3.0.0', 'paths': {}})
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await check_documentation_json(
+            'http://127.0.0.1:8000', client=client
+        )
+
+    assert (
+        'REST API JSON documentation found at http://127.0.0.1:8000/redoc'
+        in result['message']
+    )
+    assert verify._endpoint_hits == {'redoc': 4}
+
+    verify._save_endpoint_hits({'redoc': 3})
+    assert orjson.loads(verify._ENDPOINT_HITS_PATH.read_bytes()) == {
+        'redoc': 4
+    }
+
+
+def test_load_endpoint_hits_ignores_invalid_counts():
+    verify._ENDPOINT_HITS_PATH.write_bytes(
+        orjson.dumps({'docs': '3', 'redoc': 2, 'swagger': None})
+    )
+
+    assert verify._load_endpoint_hits() == {'redoc': 2}
+
+
+@respx.mock
+async def test_check_documentation_json_revalidates_cached_doc(client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json={'openapi': '3.0.0', 'paths': {}},
+            headers={'ETag': '"v1"'},
+        )
+
+    respx.route(host='cached.test').mock(side_effect=handler)
+
+    first = await check_documentation_json(
+        'http://cached.test',
+        'openapi.json',
+        client=client,
+        cache_ttl=0,
+    )
+    second = await check_documentation_json(
+        'http://cached.test',
+        'openapi.json',
+        client=client,
+        cache_ttl=0,
+    )
+
+    assert first['status'] == 'success'
+    assert second == first
+    assert len(requests) == 2
+    assert requests[-1].headers['If-None-Match'] == '"v1"'
+
+
+@respx.mock
+async def test_check_documentation_json_revalidation_checks_changed_doc(
+    client,
+):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(
+                200,
+                json={'openapi': '3.0.0', 'paths': {}},
+                headers={'ETag': '"v1"'},
+            )
+        return httpx.Response(
+            200,
+            text=HTML_PAGE,
+            headers={'Content-Type': 'application/json'},
+        )
+
+    respx.route(host='cached.test').mock(side_effect=handler)
+
+    await check_documentation_json(
+        'http://cached.test',
+        'openapi.json',
+        client=client,
+        cache_ttl=0,
+    )
+    result = await check_documentation_json(
+        'http://cached.test',
+        'openapi.json',
+        client=client,
+        cache_ttl=0,
+    )
+
+    assert result['status'] != 'success'
+    assert len(requests) == 3
+    assert not verify._documentation_cache
+
+
+@respx.mock
+async def test_check_documentation_json_reuses_fresh_cached_doc(client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={'openapi': '3.0.0', 'paths': {}})
+
+    respx.route(host='cached.test').mock(side_effect=handler)
+
+    first = await check_documentation_json(
+        'http://cached.test', 'openapi.json', client=client
+    )
+    second = await check_documentation_json(
+        'http://cached.test', 'openapi.json', client=client
+    )
+
+    assert first['status'] == 'success'
+    assert second == first
+    assert len(requests) == 1
+
+
+@respx.mock
+async def test_check_documentation_json_without_cache(client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={'openapi': '3.0.0', 'paths': {}})
+
+    respx.route(host='cached.test').mock(side_effect=handler)
+
+    for _ in range(2):
+        await check_documentation_json(
+            'http://cached.test',
+            'openapi.json',
+            client=client,
+            use_cache=False,
+        )
+
+    assert len(requests) == 2
+    assert not verify._documentation_cache
+
+
+async def test_check_documentation_json_own_client_skips_cache():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={'openapi': '3.0.0', 'paths': {}})
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(2):
+            await check_documentation_json(
+                'http://cached.test', 'openapi.json', client=client
+            )
+
+    assert len(requests) == 2
+    assert not verify._documentation_cache
+
+
+@respx.mock
+async def test_check_documentation_json_coalesces_concurrent_checks(client):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={'openapi': '3.0.0', 'paths': {}})
+
+    respx.route(host='shared.test').mock(side_effect=handler)
+
+    first, second = await asyncio.gather(
+        check_documentation_json(
+            'http://shared.test', 'openapi.json', client=client
+        ),
+        check_documentation_json(
+            'http://shared.test', 'openapi.json', client=client
+        ),
+    )
+
+    assert first['status'] == 'success'
+    assert second == first
+    assert len(requests) == 1
+
+
+@google_mock
+async def test_check_documentation_json_no_api_doc(client):
+    result = await check_documentation_json(
+        'https://google.com', 'swagger.json', client=client
     )
     assert result['status'] == 'error'
     assert 'No REST API documentation found' in result['message']
@@ -92,8 +648,11 @@ def test_check_documentation_json_no_api_doc():
     )
 
 
-def test_check_documentation_json_no_api_no_doc():
-    result = asyncio.run(check_documentation_json('https://google.com'))
+@google_mock
+async def test_check_documentation_json_no_api_no_doc(client):
+    result = await check_documentation_json(
+        'https://google.com', client=client
+    )
     assert result['status'] == 'error'
     assert 'No REST API documentation found' in result['message']
     assert (
@@ -102,9 +661,11 @@ def test_check_documentation_json_no_api_no_doc():
     )
 
 
-def test_check_documentation_json_invalid_url_doc():
+@unreachable_mock
+async def test_check_documentation_json_invalid_url_doc(client):
     invalid_url = 'https://invalid_url.com'
-    result = asyncio.run(check_documentation_json(invalid_url))
+
+    result = await check_documentation_json(invalid_url, client=client)
     assert result['status'] == 'error'
     assert 'No REST API documentation found' in result['message']
     assert (
@@ -117,9 +678,9 @@ def test_check_documentation_json_invalid_url_doc():
     )
 
 
-def test_check_documentation_json_invalid_url_no_doc():
+async def test_check_documentation_json_invalid_url_no_doc():
     invalid_url = 'invalid_url.com'
-    result = asyncio.run(check_documentation_json(invalid_url, 'swagger.json'))
+    result = await check_documentation_json(invalid_url, 'swagger.json')
     assert result['status'] == 'error'
     assert 'No REST API documentation found' in result['message']
     assert (
@@ -132,9 +693,17 @@ def test_check_documentation_json_invalid_url_no_doc():
     )
 
 
-def test_check_documentation_json_potential_doc_but_no_json_no_doc():
+@respx.mock
+async def test_check_documentation_json_potential_doc_but_no_json_no_doc(
+    client,
+):
     uri = 'https://developer.twitter.com/en/docs/twitter-api/'
-    result = asyncio.run(check_documentation_json(uri))
+    respx.route(url=uri.rstrip('/')).respond(
+        200, html='<html><body>Twitter API documentation</body></html>'
+    )
+    respx.route(host='developer.twitter.com').respond(404, html=HTML_PAGE)
+
+    result = await check_documentation_json(uri, client=client)
     assert result['status'] == 'warning'
     assert (
         f'Potential REST API documentation found at {uri}, but not in JSON format'
@@ -146,45 +715,236 @@ def test_check_documentation_json_potential_doc_but_no_json_no_doc():
     )
 
 
-def test_analyze_api_maturity():
-    result = asyncio.run(
-        analyze_api_maturity('https://petstore.swagger.io/v2/swagger.json')
+async def test_verify_maturity_paths_messages():
+    paths = {
+        '/pets': {
+            'get': {'responses': {'200': {'description': 'OK'}}},
+            'post': {'responses': {'200': {'description': 'OK'}}},
+        },
+        '/pets/{id}': {
+            'put': {'responses': {'200': {'description': 'Updated'}}},
+            'options': {},
+        },
+    }
+
+    result = await _verify_maturity_paths(paths)
+
+    assert result['messages'] == [
+        '✅   Congratulations! The /pets path for GET requests returns the correct status code (200) and description',
+        '🚫   Error! The /pets path for POST requests is missing the expected 201 status code',
+        '✅   Congratulations! The /pets/{id} method returns the correct status code for PUT requests',
+        '⚠️   Warning! The /pets/{id} path for PUT requests should return the description "OK" for the 200 status code, but it returns "Updated" instead',
+        '🚫   Alert! The /pets/{id} path uses a non-conventional OPTIONS method. Consider following the standard RESTful methods for better maturity.',
+        "✅   Congratulations! The API has methods other than POST. It is at least at level 1 of Richardson's maturity model",
+    ]
+
+
+async def test_verify_maturity_paths_only_post():
+    paths = {
+        '/rpc': {'post': {'responses': {'201': {'description': 'Created'}}}}
+    }
+
+    result = await _verify_maturity_paths(paths)
+
+    assert result['messages'][-1] == (
+        "🚫   Error! The API only has POST methods. It is at level 0 of Richardson's maturity model"
     )
+
+
+async def test_verify_maturity_paths_null_responses():
+    paths = {'/items': {'get': {'responses': None}}}
+
+    result = await _verify_maturity_paths(paths)
+
+    assert result['messages'][0] == (
+        '🚫   Error! The /items path for GET requests is missing the expected 200 status code'
+    )
+
+
+@petstore_mock
+async def test_analyze_api_maturity(client):
+    result = await analyze_api_maturity(PETSTORE_DOC_URL, client=client)
     assert result['status'] == 'success'
     assert result['feedback']['messages'] is not None
 
 
-def test_analyze_api_maturity_invalid_url():
-    result = asyncio.run(analyze_api_maturity('https://invalid_url'))
+async def test_analyze_api_maturity_checks_https_alongside_documentation():
+    def handler(request):
+        if request.url.scheme == 'https':
+            return httpx.Response(200)
+        return httpx.Response(
+            200, json={'openapi': '3.0.0', 'paths': {'/pets': {'get': {}}}}
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await analyze_api_maturity(
+            'http://127.0.0.1:8000', 'openapi.json', client=client
+        )
+        fast_result = await analyze_api_maturity(
+            'http://127.0.0.1:8000',
+            'openapi.json',
+            client=client,
+            check_https=False,
+        )
+
+    assert result['status'] == 'success'
+    assert 'URI supports HTTPS' in result['https']
+    assert fast_result['status'] == 'success'
+    assert 'https' not in fast_result
+
+
+async def test_analyze_api_maturity_awaits_cancelled_https_check():
+    async def handler(request):
+        if request.url.scheme == 'https':
+            await asyncio.sleep(10)
+            return httpx.Response(200)
+        return httpx.Response(404)
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await analyze_api_maturity(
+            'http://127.0.0.1:8000', 'openapi.json', client=client
+        )
+        pending = [
+            task
+            for task in asyncio.all_tasks()
+            if task.get_coro().__name__ == '_supports_https'
+        ]
+
+    assert result['status'] == 'error'
+    assert pending == []
+
+
+@unreachable_mock
+async def test_analyze_api_maturity_invalid_url(client):
+    result = await analyze_api_maturity('https://invalid_url', client=client)
     assert result['status'] == 'error'
     assert 'No REST API documentation found' in result['message']
 
 
-def test_supports_https_success():
-    result = asyncio.run(
-        _supports_https('https://nv-research-tlv.netlify.app/')
+@respx.mock
+async def test_supports_https_success(client):
+    respx.get('https://nv-research-tlv.netlify.app/').respond(
+        200, html=HTML_PAGE
+    )
+
+    result = await _supports_https(
+        'https://nv-research-tlv.netlify.app/', client=client
     )
     assert result['status'] == 'success'
     assert 'URI supports HTTPS' in result['message']
 
 
-def test_supports_https_failure():
-    result = asyncio.run(_supports_https('https://petstore.swagger.io/v2'))
+async def test_supports_https_does_not_read_body():
+    class Body(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            raise AssertionError('body should not be read')
+            yield b''
+
+    def handler(request):
+        assert request.url.scheme == 'https'
+        return httpx.Response(
+            200, headers={'Content-Type': 'text/html'}, stream=Body()
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await _supports_https('http://127.0.0.1:8000', client)
+
+    assert result['status'] == 'success'
+    assert result['response'] == '200 OK (text/html)'
+
+
+@petstore_mock
+async def test_supports_https_failure(client):
+    result = await _supports_https(
+        'https://petstore.swagger.io/v2', client=client
+    )
     assert result['status'] == 'error'
     assert 'URI does not support HTTPS' in result['message']
 
 
-def test_estimate_rate_limit_success():
+@respx.mock
+async def test_estimate_rate_limit_success(client):
     api_url = 'https://petstore.swagger.io/v2/pet/1'
     max_requests = 100
-    result = asyncio.run(estimate_rate_limit(api_url, max_requests))
+    respx.get(api_url).respond(200, json={'id': 1})
+
+    result = await estimate_rate_limit(api_url, max_requests, client=client)
     assert result['status'] == 'success'
     assert 'requests were successful without 429 errors' in result['message']
 
 
-def test_estimate_rate_limit_request_error():
+@unreachable_mock
+async def test_estimate_rate_limit_request_error(client):
     api_url = 'https://api-with-request-error.com'
     max_requests = 100
-    result = asyncio.run(estimate_rate_limit(api_url, max_requests))
+
+    result = await estimate_rate_limit(api_url, max_requests, client=client)
     assert result['status'] == 'error'
     assert 'An error occurred while requesting' in result['message']
+
+
+async def test_estimate_rate_limit_stops_at_first_429():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        if len(calls) > 10:
+            return httpx.Response(429)
+        return httpx.Response(200)
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await estimate_rate_limit(
+            'http://127.0.0.1:8000', 1000, client=client
+        )
+
+    assert result['status'] == 'error'
+    assert 'The API returned a 429 error' in result['message']
+    assert len(calls) < 1000
+
+
+async def test_estimate_rate_limit_respects_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await estimate_rate_limit(
+            'http://127.0.0.1:8000', 40, client=client, concurrency=5
+        )
+
+    assert result['status'] == 'success'
+    assert peak == 5
+
+
+async def test_estimate_rate_limit_reads_bodies():
+    drained = []
+
+    async def body():
+        yield b'{"id": '
+        yield b'1}'
+        drained.append(True)
+
+    def handler(request):
+        return httpx.Response(200, content=body())
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        result = await estimate_rate_limit(
+            'http://127.0.0.1:8000', 10, client=client
+        )
+
+    assert result['status'] == 'success'
+    assert len(drained) == 10